@@ -27,6 +27,7 @@ from operator import itemgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 import gym
+import numpy as np
 import orjson
 from gym.wrappers import TimeLimit
 
@@ -102,13 +103,14 @@ class SizeAgent(BaseAgent):
 
         :param info: an info dict (parm of environment response)
         """
-        parsed_state_diff = tuple(map(orjson.loads, info[STATE_DIFF_UPDATED]))
-        self._state.update(
-            {
-                clause["label"]: (clause_length(clause), clause["processed"])
-                for clause in parsed_state_diff
-            }
-        )
+        for clause in map(orjson.loads, info[STATE_DIFF_UPDATED]):
+            label = clause["label"]
+            length = (
+                self._state[label][0]
+                if label in self._state
+                else clause_length(clause)
+            )
+            self._state[label] = (length, clause["processed"])
 
     def get_action(
         self,
@@ -140,13 +142,7 @@ class AgeAgent(BaseAgent):
         reward: float,
         info: Dict[str, Any],
     ) -> int:  # noqa: D102
-        return min(
-            i
-            for i, clause in enumerate(
-                map(orjson.loads, observation["real_obs"])
-            )
-            if not clause["processed"]
-        )
+        return int(np.argmax(observation["action_mask"]))
 
 
 class SizeAgeAgent(BaseAgent):
@@ -199,13 +195,7 @@ class RandomAgent(BaseAgent):
         info: Dict[str, Any],
     ) -> int:  # noqa: D102
         return random.choice(
-            [
-                i
-                for i, clause in enumerate(
-                    map(orjson.loads, observation["real_obs"])
-                )
-                if not clause["processed"]
-            ]
+            np.flatnonzero(observation["action_mask"]).tolist()
         )
 
 
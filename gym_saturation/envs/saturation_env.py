@@ -20,7 +20,18 @@ Saturation Environment
 import dataclasses
 import os
 import random
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
 import orjson
@@ -45,8 +56,22 @@ STATE_DIFF_UPDATED = "state_diff_updated"
 POSITIVE_ACTIONS = "positive_actions"
 PROBLEM_FILENAME = "problem_filename"
 MAX_CLAUSES = 100000
+CachedValue = TypeVar("CachedValue")
+
+
+def _cached_by_label(
+    cache: Dict[str, Tuple[Clause, CachedValue]],
+    clause: Clause,
+    function: Callable[[Clause], CachedValue],
+) -> CachedValue:
+    cached = cache.get(clause.label)
+    if cached is None or cached[0] is not clause:
+        cached = (clause, function(clause))
+        cache[clause.label] = cached
+    return cached[1]
 
 
+# pylint: disable=too-many-instance-attributes
 class SaturationEnv(Env):
     """
     Saturation algorithm defined in a Reiforcement Learning friendly way.
@@ -167,6 +192,7 @@ class SaturationEnv(Env):
         self.problem_list = problem_list
         self._state: Dict[str, Clause] = {}
         self._state_set: Set[Tuple[bytes, ...]] = set()
+        self._reset_caches()
         self.action_space = spaces.Discrete(max_clauses)
         self.observation_space = spaces.Dict(
             {
@@ -175,10 +201,14 @@ class SaturationEnv(Env):
             }
         )
         self.problem: Optional[str] = None
-        tptp_folder = os.path.join(
-            os.path.dirname(problem_list[0]), "..", ".."
+        self._tptp_parser = TPTPParser(
+            os.path.join(os.path.dirname(problem_list[0]), "..", ".."),
+            extendable=True,
         )
-        self._tptp_parser = TPTPParser(tptp_folder, extendable=True)
+
+    def _reset_caches(self) -> None:
+        self._serialized: Dict[str, Tuple[Clause, bytes]] = {}
+        self._pretty_printed: Dict[str, Tuple[Clause, str]] = {}
 
     def _init_clauses(self) -> Dict[str, Clause]:
         self.problem = random.choice(self.problem_list)
@@ -198,6 +228,7 @@ class SaturationEnv(Env):
 
     def reset(self) -> Union[dict, Tuple[dict, dict]]:  # noqa: D102
         self._state = reindex_variables(self._init_clauses())
+        self._reset_caches()
         self._state_set = set(
             map(
                 lambda clause: tuple(
@@ -223,7 +254,7 @@ class SaturationEnv(Env):
 
     def _do_deductions(self, action: int) -> Tuple[bytes, ...]:
         state_len_before = len(self._state)
-        given_clause_label, given_clause = list(self._state.items())[action]
+        given_clause = self._clause_at(action)
         unprocessed_clauses = tuple(
             clause for clause in self._state.values() if clause.processed
         )
@@ -249,19 +280,23 @@ class SaturationEnv(Env):
                 given_clause,
             )
         )
-        self._state[given_clause_label] = dataclasses.replace(
+        self._state[given_clause.label] = dataclasses.replace(
             given_clause, processed=True
         )
         return tuple(
-            map(orjson.dumps, list(self._state.values())[state_len_before:])
-        ) + (orjson.dumps(list(self._state.values())[action]),)
+            map(
+                self._serialize,
+                islice(self._state.values(), state_len_before, None),
+            )
+        ) + (self._serialize(self._state[given_clause.label]),)
+
+    def _clause_at(self, action: int) -> Clause:
+        return tuple(islice(self._state.values(), action, action + 1))[0]
 
     def _proof_found_result(
         self, reward: float, info: Dict[str, Any]
     ) -> Tuple[float, bool, Dict[str, Any]]:
-        if tuple(
-            True for clause in self._state.values() if clause.literals == ()
-        ):
+        if any(clause.literals == () for clause in self._state.values()):
             info[POSITIVE_ACTIONS] = self.positive_actions
             return 1.0, True, info
         return reward, False, info
@@ -297,7 +332,7 @@ class SaturationEnv(Env):
         :raises ValueError: if the ``action`` identifies an already processed
             clause
         """
-        if list(self._state.values())[action].processed:
+        if self._clause_at(action).processed:
             raise ValueError(f"action {action} is not valid")
         updated = self._do_deductions(action)
         reward = 0.0
@@ -318,34 +353,39 @@ class SaturationEnv(Env):
     # pylint: disable=inconsistent-return-statements
     def render(self, mode="human"):  # noqa: D102
         if mode == "ansi":
-            return self.state["real_obs"]
+            return self._real_obs
         if mode == "human":
-            return "\n".join(
-                map(
-                    self._tptp_parser.cnf_parser.pretty_print,
-                    self._state.values(),
-                )
-            )
+            return "\n".join(map(self._pretty_print, self._state.values()))
         super().render(mode=mode)
 
     @property
     def state(self) -> dict:
         """Return environment state in Python ``dict`` format."""
-        return {
-            "real_obs": [
-                orjson.dumps(clause) for clause in self._state.values()
-            ],
-            "action_mask": (
-                np.array(
-                    [
-                        0.0 if clause.processed else 1.0
-                        for clause in self._state.values()
-                    ]
-                    + self.action_space.n * [0.0],
-                    np.float32,
-                )
-            )[: self.action_space.n],
-        }
+        action_mask = np.zeros(self.action_space.n, dtype=np.float32)
+        masked_count = min(len(self._state), self.action_space.n)
+        action_mask[:masked_count] = np.fromiter(
+            (
+                not clause.processed
+                for clause in islice(self._state.values(), masked_count)
+            ),
+            dtype=np.float32,
+            count=masked_count,
+        )
+        return {"real_obs": self._real_obs, "action_mask": action_mask}
+
+    @property
+    def _real_obs(self) -> List[bytes]:
+        return list(map(self._serialize, self._state.values()))
+
+    def _serialize(self, clause: Clause) -> bytes:
+        return _cached_by_label(self._serialized, clause, orjson.dumps)
+
+    def _pretty_print(self, clause: Clause) -> str:
+        return _cached_by_label(
+            self._pretty_printed,
+            clause,
+            self._tptp_parser.cnf_parser.pretty_print,
+        )
 
     def seed(self, seed=None):  # noqa: D102
         random.seed(seed)
@@ -357,7 +397,7 @@ class SaturationEnv(Env):
         return "\n".join(
             reversed(
                 [
-                    self._tptp_parser.cnf_parser.pretty_print(clause)
+                    self._pretty_print(clause)
                     for clause in reduce_to_proof(self._state)
                     if clause.inference_rule is not None
                 ]
@@ -371,9 +411,11 @@ class SaturationEnv(Env):
 
         If there is no proof yet, raises an error.
         """
-        proof = reduce_to_proof(self._state)
+        proof_labels = {
+            clause.label for clause in reduce_to_proof(self._state)
+        }
         return tuple(
             action
-            for action, clause in enumerate(self._state.values())
-            if clause in proof
+            for action, label in enumerate(self._state)
+            if label in proof_labels
         )
@@ -22,7 +22,6 @@ import os
 import random
 from typing import Dict, List, Tuple, Union
 
-import orjson
 from tptp_lark_parser.grammar import Clause
 
 from gym_saturation.envs.saturation_env import MAX_CLAUSES, SaturationEnv
@@ -117,6 +116,7 @@ class VampireEnv(SaturationEnv):
         tptp_folder = os.path.join(os.path.dirname(self.problem), "..", "..")
         vampire_response = self._vampire.start(self.problem, tptp_folder)
         self._state = {}
+        self._reset_caches()
         updated = self._parse_vampire_reponse(vampire_response)
         self._state = {
             clause.label: dataclasses.replace(clause, birth_step=0)
@@ -125,9 +125,9 @@ class VampireEnv(SaturationEnv):
         return self.state
 
     def _do_deductions(self, action: int) -> Tuple[bytes, ...]:
-        given_clause = list(self._state.values())[action]
+        given_clause = self._clause_at(action)
         updated = self._parse_vampire_reponse(
             self._vampire.pick_a_clause(given_clause.label)
         )
         self._state.update(updated)
-        return tuple(map(orjson.dumps, updated.values()))
+        return tuple(map(self._serialize, updated.values()))
@@ -20,7 +20,7 @@ Logic Operations Utils
 import dataclasses
 from itertools import chain
 from operator import attrgetter
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Dict, List, Set, Tuple, Union
 
 from tptp_lark_parser.grammar import (
     EQUALITY_SYMBOL_ID,
@@ -85,7 +85,7 @@ def get_variable_list(
 
 
 def _shift_variables(
-    clauses: Dict[str, Clause], variable_list: Tuple[Variable, ...], shift: int
+    clauses: Dict[str, Clause], variable_list: Set[Variable], shift: int
 ) -> Dict[str, Clause]:
     new_clauses: Dict[str, Clause] = {}
     for label, clause in clauses.items():
@@ -174,6 +174,18 @@ def is_tautology(clause: Clause) -> bool:
     return False
 
 
+def _visit_json_node(node: Dict[str, Any], stack: List[Any]) -> int:
+    length = 0
+    for key, value in node.items():
+        if key in {"negated", "index"}:
+            length += 1
+        if isinstance(value, dict):
+            stack.append(value)
+        if isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return length
+
+
 def clause_length(clause: dict) -> int:
     """
     Find the length of arguments of each predicate.
@@ -191,15 +203,11 @@ def clause_length(clause: dict) -> int:
     3
     """
     length = 0
-    if isinstance(clause, dict):
-        for key, value in clause.items():
-            if key in {"negated", "index"}:
-                length += 1
-            if isinstance(value, dict):
-                length += clause_length(value)
-            if isinstance(value, (list, tuple)):
-                for item in value:
-                    length += clause_length(item)
+    stack: List[Any] = [clause]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            length += _visit_json_node(item, stack)
     return length
 
 
@@ -346,8 +354,8 @@ def replace_subterm_by_index(
     raise NoSubtermFound(subterm_length)
 
 
-def _flat_list(list_of_lists: Tuple[Tuple[Any, ...], ...]) -> Tuple[Any, ...]:
-    return tuple(set(chain(*list_of_lists)))
+def _flat_list(list_of_lists: Tuple[Tuple[Any, ...], ...]) -> Set[Any]:
+    return set(chain.from_iterable(list_of_lists))
 
 
 def reduce_to_proof(clauses: Dict[str, Clause]) -> Tuple[Clause, ...]:
@@ -373,30 +381,24 @@ def reduce_to_proof(clauses: Dict[str, Clause]) -> Tuple[Clause, ...]:
         clause for clause in clauses.values() if clause.literals == tuple()
     )
     if len(empty_clauses) == 1:
-        reduced: Tuple[Clause, ...] = ()
+        reduced: List[Clause] = []
+        visited: Set[str] = set()
         new_reduced: Tuple[Clause, ...] = (empty_clauses[0],)
         while len(new_reduced) > 0:
-            reduced += tuple(
-                clause for clause in new_reduced if clause not in reduced
-            )
+            reduced.extend(new_reduced)
+            visited.update(clause.label for clause in new_reduced)
             new_reduced = tuple(
                 clauses[label]
-                for label in tuple(
-                    reversed(
-                        sorted(
-                            _flat_list(
-                                tuple(
-                                    (
-                                        ()
-                                        if clause.inference_parents is None
-                                        else clause.inference_parents
-                                    )
-                                    for clause in new_reduced
-                                )
-                            )
-                        )
-                    )
+                for label in sorted(
+                    {
+                        label
+                        for clause in new_reduced
+                        if clause.inference_parents is not None
+                        for label in clause.inference_parents
+                        if label not in visited
+                    },
+                    reverse=True,
                 )
             )
-        return reduced
+        return tuple(reduced)
     raise WrongRefutationProofError
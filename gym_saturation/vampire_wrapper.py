@@ -17,10 +17,15 @@
 Vampire Wrapper
 ================
 """
-from typing import Tuple
+import re
+from typing import List, Tuple
 
 import pexpect
 
+CLAUSE_LINE_PATTERN = re.compile(
+    rb"(?:\[SA\] (.+?)|\[PP\] (final|input|fn def discovered)): (.+?)\. (.*)"
+)
+
 
 class VampireWrapper:
     """
@@ -69,19 +74,19 @@ class VampireWrapper:
         self._proc = None
 
     def _get_stdout(self) -> Tuple[Tuple[str, str, str], ...]:
-        result: Tuple[Tuple[str, str, str], ...] = ()
-        self.proc.expect(["Pick a clause:", pexpect.EOF])
-        for line in self.proc.before.decode("utf-8").split("\r\n"):
-            if (
-                line[:5] == "[SA] "
-                or line[:12] in {"[PP] final: ", "[PP] input: "}
-                or "[PP] fn def discovered: " in line
-            ):
-                result_type, result_body = line[5:].split(": ")
-                clause_label, clause = result_body.split(". ")
-                result += ((result_type, clause_label, clause),)
+        result: List[Tuple[str, str, str]] = []
+        self.proc.expect_exact(["Pick a clause:", pexpect.EOF])
+        for line in self.proc.before.split(b"\r\n"):
+            match = CLAUSE_LINE_PATTERN.fullmatch(line)
+            if match is not None:
+                result_type, clause_label, clause = (
+                    group.decode("utf-8")
+                    for group in match.groups()
+                    if group is not None
+                )
+                result.append((result_type, clause_label, clause))
         if result:
-            return result
+            return tuple(result)
         raise ValueError(self.proc.before.decode("utf-8"))
 
     def start(
@@ -101,7 +106,8 @@ class VampireWrapper:
         self._proc = pexpect.spawn(
             f"{self.binary_path} --manual_cs on --show_everything on "
             + "--time_limit 1D --avatar off "
-            + f"--include {tptp_folder} {problem_filename}"
+            + f"--include {tptp_folder} {problem_filename}",
+            maxread=65536,
         )
         return self._get_stdout()
 
@@ -13,7 +13,8 @@
 # limitations under the License.
 """ a helper function for running agent testing on a Slurm cluster """
 import os
-from glob import glob
+from glob import iglob
+from itertools import islice
 
 
 def get_filename() -> str:
@@ -21,12 +22,19 @@ def get_filename() -> str:
     :returns: a TPTP v7.5.0 CNF problem filename with the absolute path
         corresponding to an environment variable ``SLURM_ARRAY_TASK_ID``
         (automatically created by `Slurm's job array functionality <https://slurm.schedmd.com/job_array.html>`__)
+    :raises IndexError: if ``SLURM_ARRAY_TASK_ID`` is past the number of
+        problem files found
     """
-    return glob(
-        os.path.join(
-            os.environ["WORK"], "data", "TPTP-v7.5.0", "Problems", "*", "*-*.p"
+    task_id = int(os.environ["SLURM_ARRAY_TASK_ID"])
+    pattern = os.path.join(
+        os.environ["WORK"], "data", "TPTP-v7.5.0", "Problems", "*", "*-*.p"
+    )
+    filename = next(islice(iglob(pattern), task_id, None), None)
+    if filename is None:
+        raise IndexError(
+            f"no problem file with index {task_id} matches {pattern}"
         )
-    )[int(os.environ["SLURM_ARRAY_TASK_ID"])]
+    return filename
 
 
 if __name__ == "__main__":